@@ -1,50 +1,104 @@
 import random
 import json
+import sys
+import bisect
 from typing import Dict, List, Tuple, Optional, Set
 from dataclasses import dataclass, field
 from enum import Enum
 import math
 
+# Interned SurrealNumbers by component triple; bounded so a long session can't grow it forever
+_SN_POOL: Dict[Tuple[float, float, float], "SurrealNumber"] = {}
+_SN_POOL_LIMIT = 4096
+
 class SurrealNumber:
     """
     Represents a surreal number in the form: a + b*ε + c*ω
     where a is real (finite), ε is infinitesimal, ω is infinite
+    
+    Instances are immutable (assignment raises AttributeError). Constructor
+    calls are interned, so equal values may share one object.
     """
     
-    def __init__(self, a: float = 0.0, b: float = 0.0, c: float = 0.0):
-        self.a = float(a)  # Real component
-        self.b = float(b)  # Infinitesimal coefficient  
-        self.c = float(c)  # Infinite coefficient
+    # Fixed slots (three components plus cached text): no per-instance __dict__,
+    # so each number is roughly the size of its fields.
+    __slots__ = ("a", "b", "c", "_str")
+    
+    def __new__(cls, a: float = 0.0, b: float = 0.0, c: float = 0.0):
+        key = (float(a), float(b), float(c))
+        obj = _SN_POOL.get(key)
+        if obj is None:
+            obj = object.__new__(cls)
+            _set = object.__setattr__
+            _set(obj, "a", key[0])  # Real component
+            _set(obj, "b", key[1])  # Infinitesimal coefficient
+            _set(obj, "c", key[2])  # Infinite coefficient
+            _set(obj, "_str", None)  # Rendered form, filled on first str()
+            if len(_SN_POOL) < _SN_POOL_LIMIT:
+                _SN_POOL[key] = obj
+        return obj
+    
+    @classmethod
+    def _new(cls, a: float, b: float, c: float) -> "SurrealNumber":
+        """Internal constructor for components that are already floats; skips coercion and interning"""
+        obj = object.__new__(cls)
+        _set = object.__setattr__
+        _set(obj, "a", a)
+        _set(obj, "b", b)
+        _set(obj, "c", c)
+        _set(obj, "_str", None)
+        return obj
+    
+    def __setattr__(self, name, value):
+        raise AttributeError("SurrealNumber is immutable")
+    
+    def __delattr__(self, name):
+        raise AttributeError("SurrealNumber is immutable")
+    
+    def __reduce__(self):
+        # Rebuild through the constructor; never let pickle/copy fill a pooled instance
+        return (SurrealNumber, (self.a, self.b, self.c))
+    
+    def __copy__(self):
+        return self
+    
+    def __deepcopy__(self, memo):
+        return self
     
     def __str__(self):
-        parts = []
-        if self.c != 0:
-            parts.append(f"{self.c}ω")
-        if self.a != 0 or not parts:
-            parts.append(f"{self.a}")
-        if self.b != 0:
-            parts.append(f"{self.b:+}ε")
-        return " + ".join(parts).replace("+ -", "- ")
+        if self._str is not None:
+            return self._str
+        a, b, c = self.a, self.b, self.c
+        # "cω + a + bε", omitting zero terms and writing "+ -x" as "- x"
+        if c:
+            text = f"{c}ω" + ((f" - {-a}" if a < 0 else f" + {a}") if a else "")
+        else:
+            text = f"{a}"
+        if b:
+            text += f" - {-b}ε" if b < 0 else f" + {b:+}ε"
+        object.__setattr__(self, "_str", text)
+        return text
     
     def __repr__(self):
         return f"SurrealNumber({self.a}, {self.b}, {self.c})"
     
     def __add__(self, other):
-        if isinstance(other, (int, float)):
-            return SurrealNumber(self.a + other, self.b, self.c)
-        return SurrealNumber(self.a + other.a, self.b + other.b, self.c + other.c)
+        # Surreal + surreal dominates; an identity check is cheaper than isinstance
+        if type(other) is SurrealNumber:
+            return SurrealNumber._new(self.a + other.a, self.b + other.b, self.c + other.c)
+        return SurrealNumber._new(self.a + other, self.b, self.c)
     
     def __radd__(self, other):
         return self.__add__(other)
     
     def __sub__(self, other):
-        if isinstance(other, (int, float)):
-            return SurrealNumber(self.a - other, self.b, self.c)
-        return SurrealNumber(self.a - other.a, self.b - other.b, self.c - other.c)
+        if type(other) is SurrealNumber:
+            return SurrealNumber._new(self.a - other.a, self.b - other.b, self.c - other.c)
+        return SurrealNumber._new(self.a - other, self.b, self.c)
     
     def __mul__(self, scalar):
         if isinstance(scalar, (int, float)):
-            return SurrealNumber(self.a * scalar, self.b * scalar, self.c * scalar)
+            return SurrealNumber._new(self.a * scalar, self.b * scalar, self.c * scalar)
         raise NotImplementedError("Only scalar multiplication supported")
     
     def __rmul__(self, scalar):
@@ -53,13 +107,8 @@ class SurrealNumber:
     def __lt__(self, other):
         """Lexicographic comparison: ω then a then ε"""
         if isinstance(other, (int, float)):
-            other = SurrealNumber(other)
-        
-        if self.c != other.c:
-            return self.c < other.c
-        if self.a != other.a:
-            return self.a < other.a
-        return self.b < other.b
+            return (self.c, self.a, self.b) < (0.0, float(other), 0.0)
+        return (self.c, self.a, self.b) < (other.c, other.a, other.b)
     
     def __le__(self, other):
         return self < other or self == other
@@ -71,22 +120,42 @@ class SurrealNumber:
         return not self < other
     
     def __eq__(self, other):
+        """Exact component-wise equality (consistent with __hash__)"""
         if isinstance(other, (int, float)):
-            other = SurrealNumber(other)
-        return abs(self.a - other.a) < 1e-10 and abs(self.b - other.b) < 1e-10 and abs(self.c - other.c) < 1e-10
+            return (self.a, self.b, self.c) == (float(other), 0.0, 0.0)
+        return (self.a, self.b, self.c) == (other.a, other.b, other.c)
     
     def __hash__(self):
         """Make SurrealNumber hashable so it can be used in sets"""
-        return hash((round(self.a, 10), round(self.b, 10), round(self.c, 10)))
+        return hash((self.a, self.b, self.c))
+    
+    def approx_equal(self, other, tol: float = 1e-10) -> bool:
+        """Equality within a tolerance, for comparing results of float arithmetic"""
+        if isinstance(other, (int, float)):
+            other = SurrealNumber(other)
+        return abs(self.a - other.a) < tol and abs(self.b - other.b) < tol and abs(self.c - other.c) < tol
     
     def is_legal(self):
         """Check if this price is legal (no positive infinite component without permits)"""
         return self.c <= 0
     
+    def accumulate_into(self, totals: List[float]):
+        """Add this number's components into a mutable [a, b, c] running total"""
+        totals[0] += self.a
+        totals[1] += self.b
+        totals[2] += self.c
+    
     def clear_omega(self):
         """Return a copy with omega component set to 0 (permit applied)"""
         return SurrealNumber(self.a, self.b, 0)
 
+# Pre-intern zero, the value the game constructs most often
+SurrealNumber(0, 0, 0)
+
+# Victory house in Carthage
+HOUSE_PRICE = 10000
+HOUSE_PRICE_SURREAL = SurrealNumber(HOUSE_PRICE, 0, 0)
+
 @dataclass
 class Good:
     id: str
@@ -111,6 +180,10 @@ class City:
     modifiers: Dict[str, CityModifier] = field(default_factory=dict)
     stock: Dict[str, int] = field(default_factory=dict)
     demand_factors: Dict[str, float] = field(default_factory=dict)
+    tradable_goods: Tuple[str, ...] = ()  # Stocked goods known to the game, in stock order
+
+# Travel durations drawn per refill of a route's sample buffer
+TRAVEL_SAMPLE_BATCH = 64
 
 @dataclass
 class Route:
@@ -119,9 +192,17 @@ class Route:
     min_days: int
     max_days: int
     base_risk: float
+    _time_buf: List[int] = field(default_factory=list, init=False, repr=False, compare=False)
+    _time_idx: int = field(default=0, init=False, repr=False, compare=False)
     
-    def travel_time(self) -> int:
-        return random.randint(self.min_days, self.max_days)
+    def travel_time(self, rng=random) -> int:
+        # Serve pre-drawn durations; draw a fresh batch once the buffer is used up
+        if self._time_idx >= len(self._time_buf):
+            self._time_buf = rng.choices(range(self.min_days, self.max_days + 1), k=TRAVEL_SAMPLE_BATCH)
+            self._time_idx = 0
+        days = self._time_buf[self._time_idx]
+        self._time_idx += 1
+        return days
 
 @dataclass
 class Ship:
@@ -146,23 +227,28 @@ class Charter:
 class NegotiationCut:
     """Represents a Dedekind cut for negotiation"""
     def __init__(self):
+        # Both sets are kept sorted ascending, so their extrema sit at the ends
         self.L: List[SurrealNumber] = []  # Left set (seller-leaning) - using list instead of set
         self.R: List[SurrealNumber] = []  # Right set (buyer-leaning)
     
+    @property
+    def max_L(self) -> Optional[SurrealNumber]:
+        return self.L[-1] if self.L else None
+    
+    @property
+    def min_R(self) -> Optional[SurrealNumber]:
+        return self.R[0] if self.R else None
+    
     def add_offer(self, price: SurrealNumber, is_seller: bool):
-        if is_seller:
-            self.L.append(price)
-        else:
-            self.R.append(price)
+        bisect.insort(self.L if is_seller else self.R, price)
     
     def find_simplest_in_gap(self) -> Optional[SurrealNumber]:
         """Find the simplest surreal number in the gap between L and R"""
-        if not self.L or not self.R:
+        max_L = self.max_L
+        min_R = self.min_R
+        if max_L is None or min_R is None:
             return None
         
-        max_L = max(self.L)
-        min_R = min(self.R)
-        
         if max_L >= min_R:
             return None  # No gap
         
@@ -173,8 +259,57 @@ class NegotiationCut:
         
         return SurrealNumber(mid_a, mid_b, mid_c)
 
+def _price_core(a: float, b: float, stock: int, player_cargo: int,
+                is_buying: bool, is_specialty: bool, rep: float) -> Tuple[float, float]:
+    """
+    Apply supply/demand spread and reputation to a base price.
+    Pure float arithmetic; returns the (real, infinitesimal) components.
+    """
+    # Base spread - merchants need profit margin
+    base_spread = 0.15  # 15% spread between buy/sell
+    
+    # Supply pressure: more stock = lower buy prices, higher sell prices
+    stock_factor = max(0.5, min(2.0, stock / 10))  # Stock pressure multiplier
+    
+    # Player inventory pressure: having goods makes selling less favorable
+    inventory_pressure = 1.0 + (player_cargo * 0.02)  # 2% penalty per unit held
+    
+    specialty_bonus = 0.05 if is_specialty else 0
+    
+    if is_buying:
+        # Player buying: pay market premium + spread
+        spread_multiplier = 1.0 + base_spread + (1.0 / stock_factor - 1.0) * 0.1
+        a *= spread_multiplier
+        
+        # Less favorable if city specializes in this good (they know its value)
+        if is_specialty:
+            a *= 1.02
+            b += 0.5
+    else:
+        # Player selling: receive discount from market price
+        spread_multiplier = 1.0 - base_spread - specialty_bonus
+        
+        # Stock pressure: more stock in market = worse sell prices
+        spread_multiplier -= (stock_factor - 1.0) * 0.05
+        
+        # Inventory pressure: having lots makes you desperate seller
+        spread_multiplier /= inventory_pressure
+        
+        a *= max(0.7, spread_multiplier)  # Minimum 30% loss protection
+        
+        # Selling in specialty cities is more favorable
+        if is_specialty:
+            b -= 0.3
+    
+    # Apply reputation (helps both buying and selling)
+    rep_bonus = rep * -0.15
+    b += rep_bonus
+    
+    return a, b
+
+
 class GameState:
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = None):
         self.current_city = "carthage"
         self.day = 1
         self.money = SurrealNumber(1240, -1, 0)  # Start with reputation edge
@@ -183,20 +318,28 @@ class GameState:
         self.charters: List[Charter] = []
         self.reputation = {"merchant_guild": 5}
         
+        # Memoized prices, keyed on every input get_price reads
+        self._price_cache: Dict[tuple, SurrealNumber] = {}
+        self._charters_version = 0  # Bumped whenever self.charters changes
+        self._net_worth_cache: Optional[SurrealNumber] = None  # Cleared by invalidate_net_worth()
+        
         # Game progression tracking
         self.game_completed = False
         self.owns_house = False
         self.start_money = SurrealNumber(1240, -1, 0)
         self.last_supply_refresh_day = 1  # Track when supplies were last refreshed
+        # Single RNG for every random draw in the game (restocks, travel, events).
+        # Unseeded games share the global random module, so random.seed() still applies.
+        self.rng = random if seed is None else random.Random(seed)
         
         # Statistics tracking
         self.stats = {
             "total_trades": 0,
             "goods_bought": {},  # good_id -> total quantity
             "goods_sold": {},   # good_id -> total quantity
-            "total_spent": SurrealNumber(),
-            "total_earned": SurrealNumber(),
-            "cities_visited": set(["carthage"]),
+            "total_spent": [0.0, 0.0, 0.0],  # [a, b, c] running totals
+            "total_earned": [0.0, 0.0, 0.0],
+            "cities_visited_mask": 0,  # bit i set = city with index i visited
             "routes_traveled": 0,
             "events_encountered": 0,
             "supply_refreshes": 0,  # Track supply refresh events
@@ -204,8 +347,22 @@ class GameState:
         
         # Initialize world
         self.goods = self._create_goods()
+        self.good_names = {good_id: good.name for good_id, good in self.goods.items()}
         self.cities = self._create_cities()
         self.routes = self._create_routes()
+        self._city_ids_tuple = tuple(self.cities)
+        self._city_bit = {city_id: i for i, city_id in enumerate(self.cities)}
+        self.mark_visited(self.current_city)
+        # Production cities discount (and restock) their specialty goods
+        self._specialty_set = frozenset((city_id, good_id) for city_id, city in self.cities.items()
+                                        for good_id, mod in city.modifiers.items() if mod.a_mod < 0)
+        self._static_price = self._build_static_prices()
+        # Flat (city, good_id, base_amount, is_specialty) rows walked by every supply refresh
+        self._restock_plan = tuple(
+            (self.cities[city_id], good_id, base_amount, (city_id, good_id) in self._specialty_set)
+            for city_id, base_stocks in self.base_stock_levels.items()
+            for good_id, base_amount in base_stocks.items()
+        )
         
     def _create_goods(self) -> Dict[str, Good]:
         return {
@@ -258,8 +415,33 @@ class GameState:
             "tin": CityModifier(-20, 0, 0),  # Local metal trade
         }
         
+        for city in cities.values():
+            city.tradable_goods = tuple(gid for gid in city.stock if gid in self.goods)
+        
         return cities
     
+    def _build_static_prices(self) -> Dict[Tuple[str, str], Tuple[float, float, float, bool]]:
+        """Precompute the base price components that depend only on world data"""
+        static_prices = {}
+        for city_id, city in self.cities.items():
+            for good_id, good in self.goods.items():
+                # Start with base price
+                static_a = good.base_a
+                static_b = good.base_b
+                static_c = 1 if good.monopoly else 0
+                # Market specialization: cities are better at buying their specialties
+                is_specialty = (city_id, good_id) in self._specialty_set
+                
+                # Apply city modifiers
+                if good_id in city.modifiers:
+                    mod = city.modifiers[good_id]
+                    static_a += mod.a_mod
+                    static_b += mod.b_mod
+                    static_c = mod.c_mod if good.monopoly else 0
+                
+                static_prices[(city_id, good_id)] = (static_a, static_b, static_c, is_specialty)
+        return static_prices
+    
     def _create_routes(self) -> List[Route]:
         return [
             Route("carthage", "gadir", 7, 10, 0.18),
@@ -272,30 +454,76 @@ class GameState:
     
     def get_net_worth(self) -> SurrealNumber:
         """Calculate total net worth including cargo value"""
-        total_worth = SurrealNumber(self.money.a, self.money.b, self.money.c)
+        if self._net_worth_cache is not None:
+            return self._net_worth_cache
+        
+        # Accumulate on plain floats; only the result becomes a SurrealNumber
+        total_a, total_b, total_c = self.money.a, self.money.b, self.money.c
         
         # Add estimated cargo value
         for good_id, quantity in self.cargo.items():
             # Use average of buy/sell prices for estimation
-            cities = list(self.cities.keys())
-            avg_price = SurrealNumber()
+            sum_a = sum_b = sum_c = 0.0
             price_count = 0
             
-            for city_id in cities:
-                try:
-                    sell_price = self.get_price(good_id, city_id, False)
-                    if sell_price.is_legal():
-                        avg_price = avg_price + sell_price
-                        price_count += 1
-                except:
+            for city_id in self._city_ids_tuple:
+                # Only pairs in the static price table can be priced at all
+                if (city_id, good_id) not in self._static_price:
                     continue
+                sell_price = self.get_price(good_id, city_id, False)
+                if sell_price.is_legal():
+                    sum_a += sell_price.a
+                    sum_b += sell_price.b
+                    sum_c += sell_price.c
+                    price_count += 1
             
             if price_count > 0:
-                avg_price.a /= price_count
-                avg_price.b /= price_count
-                total_worth = total_worth + (avg_price * quantity)
+                total_a += sum_a / price_count * quantity
+                total_b += sum_b / price_count * quantity
+                total_c += sum_c * quantity
         
-        return total_worth
+        self._net_worth_cache = SurrealNumber(total_a, total_b, total_c)
+        return self._net_worth_cache
+    
+    def invalidate_net_worth(self):
+        """Forget the cached net worth after money, cargo or prices change"""
+        self._net_worth_cache = None
+    
+    # Money and cargo only change through these helpers, so the net-worth cache can't go stale
+    def pay(self, amount):
+        """Deduct a SurrealNumber or plain amount from cash"""
+        self.money = self.money - amount
+        self.invalidate_net_worth()
+    
+    def receive(self, amount):
+        """Add a SurrealNumber or plain amount to cash"""
+        self.money = self.money + amount
+        self.invalidate_net_worth()
+    
+    def load_cargo(self, good_id: str, quantity: int):
+        """Add goods to the hold"""
+        self.cargo[good_id] = self.cargo.get(good_id, 0) + quantity
+        self.invalidate_net_worth()
+    
+    def unload_cargo(self, good_id: str, quantity: int):
+        """Remove goods from the hold, dropping the entry once it is empty"""
+        self.cargo[good_id] -= quantity
+        if self.cargo[good_id] == 0:
+            del self.cargo[good_id]
+        self.invalidate_net_worth()
+    
+    def mark_visited(self, city_id: str):
+        """Record a visit to a city in the visited-cities bitmask"""
+        self.stats["cities_visited_mask"] |= 1 << self._city_bit[city_id]
+    
+    def visited_city_count(self) -> int:
+        """Number of distinct cities visited so far"""
+        return bin(self.stats["cities_visited_mask"]).count("1")
+    
+    def visited_city_ids(self) -> List[str]:
+        """Visited city ids, in world order"""
+        mask = self.stats["cities_visited_mask"]
+        return [city_id for city_id, bit in self._city_bit.items() if mask >> bit & 1]
     
     def check_supply_refresh(self):
         """Check if it's time to refresh city supplies (every 14 days)"""
@@ -311,113 +539,85 @@ class GameState:
         """Refresh supplies in all cities based on their specialties"""
         refresh_messages = []
         
-        for city_id, city in self.cities.items():
-            base_stocks = self.base_stock_levels[city_id]
+        # Draw every random adjustment up front in two batched calls
+        plan = self._restock_plan
+        specialty_draws = self.rng.choices(range(2, 9), k=len(plan))
+        regular_draws = self.rng.choices(range(-2, 5), k=len(plan))
+        
+        for (city, good_id, base_amount, is_specialty), extra_production, variance in zip(
+                plan, specialty_draws, regular_draws):
+            current_stock = city.stock.get(good_id, 0)
             
-            for good_id, base_amount in base_stocks.items():
-                current_stock = city.stock.get(good_id, 0)
-                
-                # Production cities get more of their specialty goods
-                is_specialty = good_id in city.modifiers and city.modifiers[good_id].a_mod < 0
-                
-                if is_specialty:
-                    # Specialty goods: restore to base + extra production
-                    extra_production = random.randint(2, 8)
-                    new_stock = base_amount + extra_production
-                    refresh_messages.append(f"   📈 {city.name}: {self.goods[good_id].name} +{new_stock - current_stock}")
-                else:
-                    # Regular goods: restore to base amount with some variance
-                    variance = random.randint(-2, 4)
-                    new_stock = max(1, base_amount + variance)
-                    
-                    if new_stock > current_stock:
-                        refresh_messages.append(f"   📦 {city.name}: {self.goods[good_id].name} +{new_stock - current_stock}")
+            # Production cities get more of their specialty goods
+            if is_specialty:
+                # Specialty goods: restore to base + extra production
+                new_stock = base_amount + extra_production
+                refresh_messages.append(f"   📈 {city.name}: {self.good_names[good_id]} +{new_stock - current_stock}")
+            else:
+                # Regular goods: restore to base amount with some variance
+                new_stock = max(1, base_amount + variance)
                 
-                city.stock[good_id] = max(current_stock, new_stock)  # Never reduce existing stock
+                if new_stock > current_stock:
+                    refresh_messages.append(f"   📦 {city.name}: {self.good_names[good_id]} +{new_stock - current_stock}")
+            
+            city.stock[good_id] = max(current_stock, new_stock)  # Never reduce existing stock
+        
+        # Stock moved everywhere, so every cached price is stale
+        self._price_cache.clear()
+        self.invalidate_net_worth()
         
         # Update statistics
         self.stats["supply_refreshes"] += 1
         
         return refresh_messages
     
+    def add_charter(self, charter: Charter):
+        """Grant a trading charter and retire prices computed without it"""
+        self.charters.append(charter)
+        self._charters_version += 1
+        self.invalidate_net_worth()
+    
+    def invalidate_prices(self, good_id: str, city_id: str):
+        """Drop cached prices for a good in a city after its stock changed"""
+        stale = [key for key in self._price_cache if key[0] == good_id and key[1] == city_id]
+        for key in stale:
+            del self._price_cache[key]
+        self.invalidate_net_worth()
+    
     def get_price(self, good_id: str, city_id: str, is_buying: bool) -> SurrealNumber:
         """Calculate the current price for a good in a city"""
-        good = self.goods[good_id]
         city = self.cities[city_id]
+        stock = city.stock.get(good_id, 0)
+        player_cargo = self.cargo.get(good_id, 0)
+        rep = self.reputation.get("merchant_guild", 0)
         
-        # Start with base price
-        price = SurrealNumber(good.base_a, good.base_b, 1 if good.monopoly else 0)
+        key = (good_id, city_id, is_buying, stock, player_cargo, rep, self._charters_version)
+        cached = self._price_cache.get(key)
+        if cached is not None:
+            return cached
         
-        # Apply city modifiers
-        if good_id in city.modifiers:
-            mod = city.modifiers[good_id]
-            price.a += mod.a_mod
-            price.b += mod.b_mod
-            price.c = mod.c_mod if good.monopoly else 0
+        # Base price with city modifiers already applied
+        base_a, base_b, c, is_specialty = self._static_price[(city_id, good_id)]
         
         # Apply charter if available
         for charter in self.charters:
             if charter.applies_to(city_id, good_id):
-                price.c = 0  # Charter clears restrictions
+                c = 0  # Charter clears restrictions
         
-        # Calculate market spread based on supply/demand dynamics
-        stock = city.stock.get(good_id, 0)
-        player_cargo = self.cargo.get(good_id, 0)
-        
-        # Base spread - merchants need profit margin
-        base_spread = 0.15  # 15% spread between buy/sell
-        
-        # Supply pressure: more stock = lower buy prices, higher sell prices
-        stock_factor = max(0.5, min(2.0, stock / 10))  # Stock pressure multiplier
-        
-        # Player inventory pressure: having goods makes selling less favorable
-        inventory_pressure = 1.0 + (player_cargo * 0.02)  # 2% penalty per unit held
-        
-        # Market specialization: cities are better at buying their specialties
-        is_specialty = good_id in city.modifiers and city.modifiers[good_id].a_mod < 0
-        specialty_bonus = 0.05 if is_specialty else 0
-        
-        if is_buying:
-            # Player buying: pay market premium + spread
-            spread_multiplier = 1.0 + base_spread + (1.0 / stock_factor - 1.0) * 0.1
-            price.a *= spread_multiplier
-            
-            # Less favorable if city specializes in this good (they know its value)
-            if is_specialty:
-                price.a *= 1.02
-                price.b += 0.5
-        else:
-            # Player selling: receive discount from market price
-            spread_multiplier = 1.0 - base_spread - specialty_bonus
-            
-            # Stock pressure: more stock in market = worse sell prices
-            spread_multiplier -= (stock_factor - 1.0) * 0.05
-            
-            # Inventory pressure: having lots makes you desperate seller
-            spread_multiplier /= inventory_pressure
-            
-            price.a *= max(0.7, spread_multiplier)  # Minimum 30% loss protection
-            
-            # Selling in specialty cities is more favorable
-            if is_specialty:
-                price.b -= 0.3
-        
-        # Apply reputation (helps both buying and selling)
-        rep_bonus = self.reputation.get("merchant_guild", 0) * -0.15
-        price.b += rep_bonus
+        a, b = _price_core(base_a, base_b, stock, player_cargo, is_buying, is_specialty, rep)
+        price = SurrealNumber(a, b, c)
         
+        self._price_cache[key] = price
         return price
     
     def can_afford_house(self) -> bool:
         """Check if player can afford the victory house (10000 coins)"""
-        house_price = SurrealNumber(10000, 0, 0)
-        return self.money >= house_price and not self.owns_house
+        return self.money >= HOUSE_PRICE_SURREAL and not self.owns_house
     
     def purchase_house(self) -> bool:
         """Purchase the victory house"""
         if self.can_afford_house():
-            house_price = SurrealNumber(10000, 0, 0)
-            self.money = self.money - house_price
+            self.pay(HOUSE_PRICE_SURREAL)
             self.owns_house = True
             self.game_completed = True
             return True
@@ -459,92 +659,146 @@ class GameState:
         
         return final_price * quantity
 
+# Market table row: good, stock, buy price, sell price, status
+MARKET_ROW_FMT = "{:<15} {:<6} {:<25} {:<25} {}".format
+
+# Victory-screen report sections, rendered with str.format_map
+VICTORY_FINANCIAL_REPORT = """
+💎 FINAL FINANCIAL REPORT:
+   Starting capital: {starting_capital:.0f} coins
+   House purchase: {house_price:,} coins
+   Remaining cash: {remaining_cash:.0f} coins
+   Final net worth: {final_net_worth:.0f} coins
+   Total profit: {total_profit:.0f} coins ({profit_pct:.1f}%)"""
+VICTORY_EFFICIENCY_REPORT = """
+📊 TRADING EFFICIENCY:
+   Total trades: {total_trades}
+   Average profit per trade: {profit_per_trade:.1f} coins
+   Average profit per day: {profit_per_day:.1f} coins"""
+
+# Victory-screen score tiers, checked in order; the first matching tier applies.
+# Days: (max days, stars, message); profit: (exceeded profit, stars, message)
+DAY_TIERS = (
+    (30, 3, "🏃‍♂️ Speed Merchant: Completed in 30 days or less"),
+    (60, 2, "⏰ Efficient Trader: Completed in 60 days or less"),
+    (math.inf, 1, "🐌 Steady Progress: Took your time"),
+)
+PROFIT_TIERS = (
+    (15000, 3, "💎 Master Merchant: Over 15,000 profit"),
+    (10000, 2, "💰 Successful Trader: Over 10,000 profit"),
+    (-math.inf, 1, "📈 Profitable Venture: Made a profit"),
+)
+# (minimum score, title)
+RATING_TIERS = (
+    (8, "🎖️ LEGENDARY PHOENICIAN MERCHANT!"),
+    (6, "🥉 EXPERT TRADER!"),
+    (4, "🥈 SKILLED MERCHANT!"),
+    (-math.inf, "🥉 NOVICE TRADER - Keep practicing!"),
+)
+
 class GameEngine:
-    def __init__(self):
-        self.state = GameState()
+    def __init__(self, seed: Optional[int] = None):
+        self.state = GameState(seed)
+        # Main-menu dispatch keyed by the typed choice; a handler returning True ends the game loop
+        self._actions = {
+            "1": self.buy_goods,
+            "2": self.sell_goods,
+            "3": self.travel,
+            "4": self.visit_shipyard,
+            "5": self.visit_tavern,
+            "6": self.view_cargo,
+            "7": self.view_statistics,
+            "8": self.buy_house,  # Checks location and ownership itself
+            "9": self.quit_game,
+        }
         
     def display_city_screen(self):
+        lines: List[str] = []
         city = self.state.cities[self.state.current_city]
-        print(f"\n{'='*60}")
-        print(f"🏛️  {city.name.upper()} - Day {self.state.day}")
-        print(f"💰 Funds: {self.state.money}")
-        print(f"🚢 Cargo: {sum(self.state.cargo.values())}/{self.state.ship.cargo_capacity}")
-        print("="*60)
+        lines.append(f"\n{'='*60}")
+        lines.append(f"🏛️  {city.name.upper()} - Day {self.state.day}")
+        lines.append(f"💰 Funds: {self.state.money}")
+        lines.append(f"🚢 Cargo: {sum(self.state.cargo.values())}/{self.state.ship.cargo_capacity}")
+        lines.append("="*60)
         
         # Show victory condition if in Carthage
         if self.state.current_city == "carthage":
             if self.state.owns_house:
-                print("🏠 You own a magnificent house in Carthage!")
+                lines.append("🏠 You own a magnificent house in Carthage!")
             elif self.state.can_afford_house():
-                print("💎 VICTORY AVAILABLE: You can afford a house! (Action 8)")
+                lines.append("💎 VICTORY AVAILABLE: You can afford a house! (Action 8)")
             else:
-                house_price = SurrealNumber(10000, 0, 0)
-                needed = house_price.a - self.state.money.a
-                print(f"🏠 Victory Goal: Buy a house for 10,000 coins (Need {needed:.0f} more)")
+                needed = HOUSE_PRICE - self.state.money.a
+                lines.append(f"🏠 Victory Goal: Buy a house for 10,000 coins (Need {needed:.0f} more)")
         
         # Check for supply refresh
         days_until_refresh = 14 - (self.state.day - self.state.last_supply_refresh_day)
         if days_until_refresh <= 3:
-            print(f"📦 Supply caravans arriving in {days_until_refresh} days")
+            lines.append(f"📦 Supply caravans arriving in {days_until_refresh} days")
         elif days_until_refresh == 14:
-            print("📦 Supply caravans just arrived!")
+            lines.append("📦 Supply caravans just arrived!")
         
-        print("\n📦 MARKET PRICES:")
-        print(f"{'Good':<15} {'Stock':<6} {'Buy Price':<25} {'Sell Price':<25} {'Status'}")
-        print("-" * 95)
+        lines.append("\n📦 MARKET PRICES:")
+        lines.append(MARKET_ROW_FMT("Good", "Stock", "Buy Price", "Sell Price", "Status"))
+        lines.append("-" * 95)
         
-        for good_id, stock in city.stock.items():
-            if good_id in self.state.goods:
-                buy_price = self.state.get_price(good_id, self.state.current_city, True)
-                sell_price = self.state.get_price(good_id, self.state.current_city, False)
+        for good_id in city.tradable_goods:
+            stock = city.stock[good_id]
+            buy_price = self.state.get_price(good_id, self.state.current_city, True)
+            sell_price = self.state.get_price(good_id, self.state.current_city, False)
+            
+            status = ""
+            if not buy_price.is_legal():
+                status = "🚫 RESTRICTED"
+            elif stock < 5:
+                status = "⚠️  Low stock"
+            elif stock > 25:
+                status = "📈 Well stocked"
+            elif good_id in self.state.cargo and self.state.cargo[good_id] > 10:
+                status = "📦 You hold many"
                 
-                status = ""
-                if not buy_price.is_legal():
-                    status = "🚫 RESTRICTED"
-                elif stock < 5:
-                    status = "⚠️  Low stock"
-                elif stock > 25:
-                    status = "📈 Well stocked"
-                elif good_id in self.state.cargo and self.state.cargo[good_id] > 10:
-                    status = "📦 You hold many"
-                    
-                # Show spread warning for expensive goods
-                spread_pct = ((buy_price.a - sell_price.a) / buy_price.a) * 100
-                if spread_pct > 20:
-                    status += " 💸 High spread"
-                    
-                print(f"{self.state.goods[good_id].name:<15} {stock:<6} {str(buy_price):<25} {str(sell_price):<25} {status}")
+            # Show spread warning for expensive goods
+            spread_pct = ((buy_price.a - sell_price.a) / buy_price.a) * 100
+            if spread_pct > 20:
+                status += " 💸 High spread"
+                
+            lines.append(MARKET_ROW_FMT(self.state.good_names[good_id], stock, str(buy_price), str(sell_price), status))
         
         # Show market analysis
-        print(f"\n💡 Market Analysis:")
-        print(f"   • Supply caravans arrive every 2 weeks (14 days)")
-        print(f"   • Next resupply in {days_until_refresh} days")
-        print(f"   • Cities produce more of their specialty goods")
-        print(f"   • Higher stock = worse sell prices, better buy prices")
+        lines.append(f"\n💡 Market Analysis:")
+        lines.append(f"   • Supply caravans arrive every 2 weeks (14 days)")
+        lines.append(f"   • Next resupply in {days_until_refresh} days")
+        lines.append(f"   • Cities produce more of their specialty goods")
+        lines.append(f"   • Higher stock = worse sell prices, better buy prices")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def display_available_actions(self):
-        print("\n🎯 Available Actions:")
-        print("1. 🛒 Buy goods")
-        print("2. 💰 Sell goods") 
-        print("3. ⛵ Travel to another city")
-        print("4. 🏪 Visit shipyard")
-        print("5. 🍺 Visit tavern (news & rumors)")
-        print("6. 📊 View cargo")
-        print("7. 📈 View statistics")
+        lines: List[str] = []
+        lines.append("\n🎯 Available Actions:")
+        lines.append("1. 🛒 Buy goods")
+        lines.append("2. 💰 Sell goods") 
+        lines.append("3. ⛵ Travel to another city")
+        lines.append("4. 🏪 Visit shipyard")
+        lines.append("5. 🍺 Visit tavern (news & rumors)")
+        lines.append("6. 📊 View cargo")
+        lines.append("7. 📈 View statistics")
         
         # Special actions based on location and status
         if self.state.current_city == "carthage" and not self.state.owns_house:
             if self.state.can_afford_house():
-                print("8. 🏠 🎉 BUY HOUSE - ACHIEVE VICTORY! (10,000 coins)")
+                lines.append("8. 🏠 🎉 BUY HOUSE - ACHIEVE VICTORY! (10,000 coins)")
             else:
-                print("8. 🏠 Buy house (10,000 coins) - Not enough money")
+                lines.append("8. 🏠 Buy house (10,000 coins) - Not enough money")
         
-        print("9. ❌ Quit game")
+        lines.append("9. ❌ Quit game")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def buy_goods(self):
         city = self.state.cities[self.state.current_city]
-        available_goods = [(gid, stock) for gid, stock in city.stock.items() 
-                          if gid in self.state.goods and stock > 0]
+        available_goods = [(gid, city.stock[gid]) for gid in city.tradable_goods
+                          if city.stock[gid] > 0]
         
         if not available_goods:
             print("❌ No goods available for purchase!")
@@ -552,10 +806,9 @@ class GameEngine:
         
         print("\n🛒 Available Goods:")
         for i, (good_id, stock) in enumerate(available_goods, 1):
-            good = self.state.goods[good_id]
             price = self.state.get_price(good_id, self.state.current_city, True)
             status = "" if price.is_legal() else " [RESTRICTED]"
-            print(f"{i}. {good.name} - Stock: {stock} - Price: {price}{status}")
+            print(f"{i}. {self.state.good_names[good_id]} - Stock: {stock} - Price: {price}{status}")
         
         try:
             choice = int(input("\nSelect good (number): ")) - 1
@@ -568,16 +821,17 @@ class GameEngine:
                     
                     if total_price and self.state.can_afford(total_price):
                         # Execute purchase
-                        self.state.money = self.state.money - total_price
-                        self.state.cargo[good_id] = self.state.cargo.get(good_id, 0) + quantity
+                        self.state.pay(total_price)
+                        self.state.load_cargo(good_id, quantity)
                         city.stock[good_id] -= quantity
+                        self.state.invalidate_prices(good_id, self.state.current_city)
                         
                         # Update statistics
                         self.state.stats["total_trades"] += 1
                         self.state.stats["goods_bought"][good_id] = self.state.stats["goods_bought"].get(good_id, 0) + quantity
-                        self.state.stats["total_spent"] = self.state.stats["total_spent"] + total_price
+                        total_price.accumulate_into(self.state.stats["total_spent"])
                         
-                        print(f"✅ Purchased {quantity}x {self.state.goods[good_id].name} for {total_price}")
+                        print(f"✅ Purchased {quantity}x {self.state.good_names[good_id]} for {total_price}")
                     else:
                         print("❌ Cannot afford or trade restricted!")
                 else:
@@ -594,7 +848,7 @@ class GameEngine:
         cargo_items = list(self.state.cargo.items())
         for i, (good_id, quantity) in enumerate(cargo_items, 1):
             price = self.state.get_price(good_id, self.state.current_city, False)
-            print(f"{i}. {self.state.goods[good_id].name} - Quantity: {quantity} - Price each: {price}")
+            print(f"{i}. {self.state.good_names[good_id]} - Quantity: {quantity} - Price each: {price}")
         
         try:
             choice = int(input("\nSelect good to sell (number): ")) - 1
@@ -607,20 +861,21 @@ class GameEngine:
                     
                     if total_price:
                         # Execute sale
-                        self.state.money = self.state.money + total_price
-                        self.state.cargo[good_id] -= quantity
-                        if self.state.cargo[good_id] == 0:
-                            del self.state.cargo[good_id]
+                        self.state.receive(total_price)
+                        self.state.unload_cargo(good_id, quantity)
                         
                         city = self.state.cities[self.state.current_city]
+                        if good_id not in city.stock:
+                            city.tradable_goods += (good_id,)
                         city.stock[good_id] = city.stock.get(good_id, 0) + quantity
+                        self.state.invalidate_prices(good_id, self.state.current_city)
                         
                         # Update statistics
                         self.state.stats["total_trades"] += 1
                         self.state.stats["goods_sold"][good_id] = self.state.stats["goods_sold"].get(good_id, 0) + quantity
-                        self.state.stats["total_earned"] = self.state.stats["total_earned"] + total_price
+                        total_price.accumulate_into(self.state.stats["total_earned"])
                         
-                        print(f"✅ Sold {quantity}x {self.state.goods[good_id].name} for {total_price}")
+                        print(f"✅ Sold {quantity}x {self.state.good_names[good_id]} for {total_price}")
                     else:
                         print("❌ Cannot complete sale!")
         except ValueError:
@@ -642,14 +897,14 @@ class GameEngine:
             choice = int(input("\nSelect destination (number): ")) - 1
             if 0 <= choice < len(available_routes):
                 route = available_routes[choice]
-                travel_time = route.travel_time()
+                travel_time = route.travel_time(self.state.rng)
                 
                 # Simple travel resolution
                 self.state.day += travel_time
                 self.state.current_city = route.to_city
                 
                 # Update statistics
-                self.state.stats["cities_visited"].add(route.to_city)
+                self.state.mark_visited(route.to_city)
                 self.state.stats["routes_traveled"] += 1
                 
                 # Check for supply refresh after travel
@@ -664,7 +919,7 @@ class GameEngine:
                         print(f"   ...and {len(refresh_messages) - 6} other supply updates")
                 
                 # Random event chance
-                if random.random() < route.base_risk:
+                if self.state.rng.random() < route.base_risk:
                     self._handle_travel_event()
                 
                 print(f"⛵ Arrived in {self.state.cities[self.state.current_city].name} after {travel_time} days")
@@ -680,7 +935,7 @@ class GameEngine:
             "🗣️ Met another trader with valuable information!"
         ]
         
-        event = random.choice(events)
+        event = self.state.rng.choice(events)
         print(f"\n🎲 EVENT: {event}")
         
         # Update statistics
@@ -688,10 +943,16 @@ class GameEngine:
         
         # Apply simple consequences
         if "Pirates" in event:
-            self.state.money = self.state.money - 50
+            self.state.pay(50)
         elif "morale" in event:
             self.state.ship.crew_morale *= 0.9
     
+    def visit_shipyard(self):
+        print("🔧 Shipyard coming soon!")
+    
+    def visit_tavern(self):
+        print("🍺 Tavern coming soon!")
+    
     def view_cargo(self):
         if not self.state.cargo:
             print("📦 Cargo hold is empty!")
@@ -701,79 +962,82 @@ class GameEngine:
         print("-" * 40)
         total_value = SurrealNumber()
         
+        good_names = self.state.good_names
         for good_id, quantity in self.state.cargo.items():
-            good = self.state.goods[good_id]
             est_value = self.state.get_price(good_id, self.state.current_city, False) * quantity
             total_value = total_value + est_value
-            print(f"{good.name}: {quantity} units (Est. value: {est_value})")
+            print(f"{good_names[good_id]}: {quantity} units (Est. value: {est_value})")
         
         print(f"\nTotal estimated value: {total_value}")
     
     def view_statistics(self):
         """Display comprehensive game statistics"""
+        lines: List[str] = []
+        good_names = self.state.good_names
+        cities = self.state.cities
         stats = self.state.stats
         
-        print(f"\n📈 TRADING STATISTICS - Day {self.state.day}")
-        print("=" * 50)
+        lines.append(f"\n📈 TRADING STATISTICS - Day {self.state.day}")
+        lines.append("=" * 50)
         
         # Financial overview
         current_worth = self.state.get_net_worth()
         profit_loss = SurrealNumber(current_worth.a - self.state.start_money.a, 
                                   current_worth.b - self.state.start_money.b, 0)
         
-        print(f"💰 Financial Status:")
-        print(f"   Starting capital: {self.state.start_money}")
-        print(f"   Current cash: {self.state.money}")
-        print(f"   Net worth: {current_worth}")
-        print(f"   Total profit/loss: {profit_loss}")
+        lines.append(f"💰 Financial Status:")
+        lines.append(f"   Starting capital: {self.state.start_money}")
+        lines.append(f"   Current cash: {self.state.money}")
+        lines.append(f"   Net worth: {current_worth}")
+        lines.append(f"   Total profit/loss: {profit_loss}")
         
         if self.state.owns_house:
-            print(f"   🏠 House value: 10,000 (VICTORY ACHIEVED!)")
+            lines.append(f"   🏠 House value: 10,000 (VICTORY ACHIEVED!)")
         
         # Trading activity
-        print(f"\n📊 Trading Activity:")
-        print(f"   Total trades: {stats['total_trades']}")
-        print(f"   Total spent: {stats['total_spent']}")
-        print(f"   Total earned: {stats['total_earned']}")
+        lines.append(f"\n📊 Trading Activity:")
+        lines.append(f"   Total trades: {stats['total_trades']}")
+        lines.append(f"   Total spent: {SurrealNumber(*stats['total_spent'])}")
+        lines.append(f"   Total earned: {SurrealNumber(*stats['total_earned'])}")
         
         # Goods breakdown
         if stats['goods_bought']:
-            print(f"\n📦 Goods Purchased:")
+            lines.append(f"\n📦 Goods Purchased:")
             for good_id, qty in stats['goods_bought'].items():
-                good_name = self.state.goods[good_id].name
-                print(f"   {good_name}: {qty} units")
+                lines.append(f"   {good_names[good_id]}: {qty} units")
         
         if stats['goods_sold']:
-            print(f"\n💰 Goods Sold:")
+            lines.append(f"\n💰 Goods Sold:")
             for good_id, qty in stats['goods_sold'].items():
-                good_name = self.state.goods[good_id].name
-                print(f"   {good_name}: {qty} units")
+                lines.append(f"   {good_names[good_id]}: {qty} units")
         
         # Travel stats
-        print(f"\n🗺️ Travel Statistics:")
-        print(f"   Cities visited: {len(stats['cities_visited'])}")
-        visited_names = [self.state.cities[city_id].name for city_id in stats['cities_visited']]
-        print(f"   Locations: {', '.join(visited_names)}")
-        print(f"   Routes traveled: {stats['routes_traveled']}")
-        print(f"   Events encountered: {stats['events_encountered']}")
-        print(f"   Supply refreshes witnessed: {stats['supply_refreshes']}")
+        lines.append(f"\n🗺️ Travel Statistics:")
+        lines.append(f"   Cities visited: {self.state.visited_city_count()}")
+        if stats['cities_visited_mask']:
+            visited_names = [cities[city_id].name for city_id in self.state.visited_city_ids()]
+            lines.append(f"   Locations: {', '.join(visited_names)}")
+        lines.append(f"   Routes traveled: {stats['routes_traveled']}")
+        lines.append(f"   Events encountered: {stats['events_encountered']}")
+        lines.append(f"   Supply refreshes witnessed: {stats['supply_refreshes']}")
         
         # Supply refresh info
         days_until_refresh = 14 - (self.state.day - self.state.last_supply_refresh_day)
-        print(f"\n📦 Supply Information:")
-        print(f"   Last supply refresh: Day {self.state.last_supply_refresh_day}")
-        print(f"   Next refresh in: {days_until_refresh} days")
-        print(f"   Cities restock specialty goods every 2 weeks")
+        lines.append(f"\n📦 Supply Information:")
+        lines.append(f"   Last supply refresh: Day {self.state.last_supply_refresh_day}")
+        lines.append(f"   Next refresh in: {days_until_refresh} days")
+        lines.append(f"   Cities restock specialty goods every 2 weeks")
         
         # Victory progress
         if not self.state.owns_house:
-            house_price = 10000
-            progress = (current_worth.a / house_price) * 100
-            print(f"\n🏠 Victory Progress:")
-            print(f"   House goal: {house_price} coins")
-            print(f"   Current progress: {progress:.1f}%")
+            progress = (current_worth.a / HOUSE_PRICE) * 100
+            lines.append(f"\n🏠 Victory Progress:")
+            lines.append(f"   House goal: {HOUSE_PRICE} coins")
+            lines.append(f"   Current progress: {progress:.1f}%")
             if progress >= 100:
-                print("   🎉 VICTORY AVAILABLE! Return to Carthage to buy your house!")
+                lines.append("   🎉 VICTORY AVAILABLE! Return to Carthage to buy your house!")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def buy_house(self):
         """Handle house purchase and victory"""
@@ -786,8 +1050,7 @@ class GameEngine:
             return
         
         if not self.state.can_afford_house():
-            house_price = 10000
-            needed = house_price - self.state.money.a
+            needed = HOUSE_PRICE - self.state.money.a
             print(f"❌ You need {needed:.0f} more coins to buy a house!")
             return
         
@@ -797,156 +1060,153 @@ class GameEngine:
     
     def show_victory_screen(self):
         """Display the final victory screen with comprehensive results"""
-        print("\n" + "="*70)
-        print("🎉🏠 VICTORY ACHIEVED! 🏠🎉")
-        print("You have purchased a magnificent house in Carthage!")
-        print("="*70)
+        lines: List[str] = []
+        good_names = self.state.good_names
+        cities = self.state.cities
+        stats = self.state.stats
+        
+        lines.append("\n" + "="*70)
+        lines.append("🎉🏠 VICTORY ACHIEVED! 🏠🎉")
+        lines.append("You have purchased a magnificent house in Carthage!")
+        lines.append("="*70)
         
         # Time to completion
-        print(f"\n⏰ COMPLETION TIME: {self.state.day} days")
+        lines.append(f"\n⏰ COMPLETION TIME: {self.state.day} days")
         
         # Final financial summary
-        final_worth = self.state.get_net_worth() + SurrealNumber(10000, 0, 0)  # Add house value back
-        total_profit = final_worth.a - self.state.start_money.a
-        
-        print(f"\n💎 FINAL FINANCIAL REPORT:")
-        print(f"   Starting capital: {self.state.start_money.a:.0f} coins")
-        print(f"   House purchase: 10,000 coins")
-        print(f"   Remaining cash: {self.state.money.a:.0f} coins") 
-        print(f"   Final net worth: {final_worth.a:.0f} coins")
-        print(f"   Total profit: {total_profit:.0f} coins ({((total_profit/self.state.start_money.a)*100):.1f}%)")
+        final_worth = self.state.get_net_worth() + HOUSE_PRICE_SURREAL  # Add house value back
+        starting_capital = self.state.start_money.a
+        remaining_cash = self.state.money.a
+        final_net_worth = final_worth.a
+        total_profit = final_net_worth - starting_capital
+        
+        total_trades = stats['total_trades']
+        report = {
+            'starting_capital': starting_capital,
+            'house_price': HOUSE_PRICE,
+            'remaining_cash': remaining_cash,
+            'final_net_worth': final_net_worth,
+            'total_profit': total_profit,
+            'profit_pct': (total_profit / starting_capital) * 100,
+            'total_trades': total_trades,
+        }
+        lines.append(VICTORY_FINANCIAL_REPORT.format_map(report))
         
         # Trading efficiency
-        stats = self.state.stats
-        if stats['total_trades'] > 0:
-            avg_profit_per_trade = total_profit / stats['total_trades']
-            avg_profit_per_day = total_profit / self.state.day
-            
-            print(f"\n📊 TRADING EFFICIENCY:")
-            print(f"   Total trades: {stats['total_trades']}")
-            print(f"   Average profit per trade: {avg_profit_per_trade:.1f} coins")
-            print(f"   Average profit per day: {avg_profit_per_day:.1f} coins")
-        
-        # Goods traded summary
-        total_bought = sum(stats['goods_bought'].values()) if stats['goods_bought'] else 0
-        total_sold = sum(stats['goods_sold'].values()) if stats['goods_sold'] else 0
-        
-        print(f"\n📦 TRADE VOLUME:")
-        print(f"   Total goods purchased: {total_bought} units")
-        print(f"   Total goods sold: {total_sold} units")
-        print(f"   Net goods traded: {total_bought + total_sold} units")
+        if total_trades > 0:
+            report['profit_per_trade'] = total_profit / total_trades
+            report['profit_per_day'] = total_profit / self.state.day
+            lines.append(VICTORY_EFFICIENCY_REPORT.format_map(report))
+        
+        # Goods traded summary; one pass per dict yields both the total and the top good
+        total_bought = 0
+        best_buy = (None, -1)
+        for good_id, qty in stats['goods_bought'].items():
+            total_bought += qty
+            if qty > best_buy[1]:
+                best_buy = (good_id, qty)
+        total_sold = 0
+        best_sell = (None, -1)
+        for good_id, qty in stats['goods_sold'].items():
+            total_sold += qty
+            if qty > best_sell[1]:
+                best_sell = (good_id, qty)
+        gross_traded = total_bought + total_sold
+        
+        lines.append(f"\n📦 TRADE VOLUME:")
+        lines.append(f"   Total goods purchased: {total_bought} units")
+        lines.append(f"   Total goods sold: {total_sold} units")
+        lines.append(f"   Gross goods traded: {gross_traded} units")
         
         # Most traded goods
-        if stats['goods_bought']:
-            best_buy = max(stats['goods_bought'].items(), key=lambda x: x[1])
-            print(f"   Most purchased: {self.state.goods[best_buy[0]].name} ({best_buy[1]} units)")
+        if best_buy[0] is not None:
+            lines.append(f"   Most purchased: {good_names[best_buy[0]]} ({best_buy[1]} units)")
         
-        if stats['goods_sold']:
-            best_sell = max(stats['goods_sold'].items(), key=lambda x: x[1])
-            print(f"   Most sold: {self.state.goods[best_sell[0]].name} ({best_sell[1]} units)")
+        if best_sell[0] is not None:
+            lines.append(f"   Most sold: {good_names[best_sell[0]]} ({best_sell[1]} units)")
         
         # Travel achievements
-        print(f"\n🗺️ EXPLORATION ACHIEVEMENTS:")
-        print(f"   Cities discovered: {len(stats['cities_visited'])}/3")
-        visited_names = [self.state.cities[city_id].name for city_id in stats['cities_visited']]
-        print(f"   Cities visited: {', '.join(visited_names)}")
-        print(f"   Routes traveled: {stats['routes_traveled']}")
-        print(f"   Adventures survived: {stats['events_encountered']}")
+        lines.append(f"\n🗺️ EXPLORATION ACHIEVEMENTS:")
+        lines.append(f"   Cities discovered: {self.state.visited_city_count()}/3")
+        if stats['cities_visited_mask']:
+            visited_names = [cities[city_id].name for city_id in self.state.visited_city_ids()]
+            lines.append(f"   Cities visited: {', '.join(visited_names)}")
+        lines.append(f"   Routes traveled: {stats['routes_traveled']}")
+        lines.append(f"   Adventures survived: {stats['events_encountered']}")
         
         # Performance rating
-        print(f"\n⭐ PERFORMANCE RATING:")
+        lines.append(f"\n⭐ PERFORMANCE RATING:")
         score = 0
-        if self.state.day <= 30:
-            score += 3
-            print("   🏃‍♂️ Speed Merchant: Completed in 30 days or less (+3 ⭐)")
-        elif self.state.day <= 60:
-            score += 2
-            print("   ⏰ Efficient Trader: Completed in 60 days or less (+2 ⭐)")
-        else:
-            score += 1
-            print("   🐌 Steady Progress: Took your time (+1 ⭐)")
+        for max_days, stars, message in DAY_TIERS:
+            if self.state.day <= max_days:
+                score += stars
+                lines.append(f"   {message} (+{stars} ⭐)")
+                break
         
-        if total_profit > 15000:
-            score += 3
-            print("   💎 Master Merchant: Over 15,000 profit (+3 ⭐)")
-        elif total_profit > 10000:
-            score += 2
-            print("   💰 Successful Trader: Over 10,000 profit (+2 ⭐)")
-        else:
-            score += 1
-            print("   📈 Profitable Venture: Made a profit (+1 ⭐)")
+        for min_profit, stars, message in PROFIT_TIERS:
+            if total_profit > min_profit:
+                score += stars
+                lines.append(f"   {message} (+{stars} ⭐)")
+                break
         
-        if len(stats['cities_visited']) == 3:
+        if self.state.visited_city_count() == 3:
             score += 2
-            print("   🌍 Explorer: Visited all cities (+2 ⭐)")
+            lines.append("   🌍 Explorer: Visited all cities (+2 ⭐)")
         
         if stats['events_encountered'] >= 5:
             score += 1
-            print("   ⚔️ Adventurer: Survived many events (+1 ⭐)")
+            lines.append("   ⚔️ Adventurer: Survived many events (+1 ⭐)")
         
-        print(f"\n   🏆 FINAL SCORE: {score}/10 ⭐")
+        lines.append(f"\n   🏆 FINAL SCORE: {score}/10 ⭐")
         
-        if score >= 8:
-            print("   🎖️ LEGENDARY PHOENICIAN MERCHANT!")
-        elif score >= 6:
-            print("   🥉 EXPERT TRADER!")
-        elif score >= 4:
-            print("   🥈 SKILLED MERCHANT!")
-        else:
-            print("   🥉 NOVICE TRADER - Keep practicing!")
+        for min_score, title in RATING_TIERS:
+            if score >= min_score:
+                lines.append(f"   {title}")
+                break
+        
+        lines.append("\n🌊 Thank you for playing Surreal Phoenicians! 🌊")
+        lines.append("=" * 70)
         
-        print("\n🌊 Thank you for playing Surreal Phoenicians! 🌊")
-        print("=" * 70)
+        sys.stdout.write("\n".join(lines) + "\n")
+    
+    def quit_game(self) -> bool:
+        print("⚓ Thanks for playing Surreal Phoenicians!")
+        return True
     
     def run_game_loop(self):
         print("🌊 Welcome to Surreal Phoenicians! 🌊")
         print("You are a trader in the ancient Mediterranean...")
         
-        while True:
-            # Check for victory condition
-            if self.state.game_completed:
-                break
-                
+        # Handlers mutate this GameState in place; it is never replaced
+        state = self.state
+        
+        # Check for victory condition
+        while not state.game_completed:
             self.display_city_screen()
             self.display_available_actions()
             
             try:
-                max_action = 9 if (self.state.current_city == "carthage" and not self.state.owns_house) else 9
-                action = int(input(f"\nChoose action (1-{max_action}): "))
+                raw = input("\nChoose action (1-9): ").strip()
+                if not raw.isdecimal():
+                    print("❌ Invalid input!")
+                    continue
+                handler = self._actions.get(raw)
                 
-                if action == 1:
-                    self.buy_goods()
-                elif action == 2:
-                    self.sell_goods()
-                elif action == 3:
-                    self.travel()
-                elif action == 4:
-                    print("🔧 Shipyard coming soon!")
-                elif action == 5:
-                    print("🍺 Tavern coming soon!")
-                elif action == 6:
-                    self.view_cargo()
-                elif action == 7:
-                    self.view_statistics()
-                elif action == 8 and self.state.current_city == "carthage" and not self.state.owns_house:
-                    self.buy_house()
-                elif action == 9:
-                    print("⚓ Thanks for playing Surreal Phoenicians!")
-                    break
-                else:
+                if handler is None:
                     print("❌ Invalid choice!")
+                elif handler():
+                    break
+                
+                if state.game_completed:
+                    break
+                input("\nPress Enter to continue...")
                     
-                if not self.state.game_completed:
-                    input("\nPress Enter to continue...")
-                    
-            except ValueError:
-                print("❌ Invalid input!")
             except KeyboardInterrupt:
                 print("\n⚓ Game ended by player.")
                 break
 
-if __name__ == "__main__":
-    # Demo of surreal number arithmetic
+def _demo():
+    """Print a short tour of surreal number arithmetic"""
     print("🔢 Surreal Number Demo:")
     price1 = SurrealNumber(120, -1, 0)  # Glass price with reputation bonus
     price2 = SurrealNumber(220, -3, 1)  # Purple dye with embargo
@@ -962,6 +1222,10 @@ if __name__ == "__main__":
     print(f"Glass < Permitted Dye? {price1 < price2.clear_omega()}")
     
     print("\n" + "="*50)
+
+if __name__ == "__main__":
+    if "--demo" in sys.argv[1:]:
+        _demo()
     
     # Run the game
     game = GameEngine()